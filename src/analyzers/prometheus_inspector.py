@@ -5,13 +5,37 @@ This module collects system metrics from Prometheus and uses AI to generate
 daily inspection reports.
 """
 
+import asyncio
 import logging
-import subprocess
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+
 import requests
-from openai import OpenAI
+from openai import AsyncOpenAI
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from ..utils import http_utils
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class MetricRow:
+    """A single metric value for one instance, as collected from Prometheus."""
+    
+    # Explicit slots (rather than slots=True) keep Python 3.8 support
+    __slots__ = ('instance', 'metric', 'value', 'display')
+    
+    instance: str
+    metric: str
+    value: float
+    display: str
+
 class PrometheusInspector:
     """Collects metrics from Prometheus and generates AI-powered inspection reports."""
     
@@ -22,6 +46,59 @@ class PrometheusInspector:
         "disk_free": 'min by (instance, mountpoint) (node_filesystem_avail_bytes{fstype=~"ext4|xfs"} / node_filesystem_size_bytes{fstype=~"ext4|xfs"}) * 100'
     }
     
+    # SRE prompt; thresholds are filled in once per inspector, data per call
+    PROMPT_TEMPLATE = """
+You are an expert SRE. Below is the system performance data for the past 7 days:
+
+{raw_data_text}
+
+Please provide a concise weekly inspection report in English with factual analysis only:
+1. Overall system health status (Normal/Warning/Critical).
+2. Highlight any instances with potential risks:
+   - CPU > {cpu_warning}%
+   - Memory > {mem_warning}%
+   - Disk free space < {disk_warning}%
+3. Identify instances with potential resource waste:
+   - List each server only once, with all its resource waste indicators on the same line
+   - Format: Server name — CPU usage: X%, Memory usage: Y% (indicate if very low)
+   - Focus on servers with very low average CPU usage (< 10-15%) and/or very low memory usage (< 20-30%)
+   - Do not create separate categories for the same server; combine all observations for each server into a single entry
+
+Use Markdown formatting with bullet points. Keep it professional and concise.
+This is a factual analysis report only - provide observations and data analysis, but do not include actionable suggestions or recommendations. Do not offer to generate additional documents or rulesets.
+"""
+    
+    # Display formatters for known metrics, called with (series labels, value)
+    _FORMATTERS = {
+        "cpu_usage": lambda labels, value: f"Avg CPU Usage: {value:.2f}%",
+        "mem_usage": lambda labels, value: f"Max Mem Usage: {value:.2f}%",
+        "disk_free": lambda labels, value: f"Min Disk Free ({labels.get('mountpoint', '/')}): {value:.2f}%"
+    }
+    
+    # Label that tags each series of the batched query with its metric name
+    BATCH_LABEL = "inspector_metric"
+    
+    # Read timeouts in seconds for one metric's query and for the batched query,
+    # which evaluates every metric's 7-day aggregation in one request
+    QUERY_TIMEOUT = 10
+    BATCH_QUERY_TIMEOUT = 30
+    
+    # Prompt text used when no metrics could be collected
+    NO_DATA_TEXT = "No data collected from Prometheus."
+    
+    # Above this many rows the prompt lists only notable instances per metric
+    DEFAULT_MAX_PROMPT_ROWS = 5000
+    
+    # Usage below these levels is always listed as a resource-waste candidate,
+    # matching the upper bounds the prompt asks the AI to look for
+    WASTE_CUTOFFS = {"cpu_usage": 15, "mem_usage": 30}
+    
+    # Seconds to reuse a Prometheus query result before asking again
+    DEFAULT_CACHE_TTL = 3600
+    
+    # Seconds to reuse a resolved container address before inspecting again
+    CONTAINER_IP_TTL = 300
+    
     def __init__(self, config):
         """
         Initialize the Prometheus inspector.
@@ -35,16 +112,43 @@ class PrometheusInspector:
         self.openai_api_key = config.get('openai_api_key')
         self.model = config.get('model', 'gpt-4o')
         self.queries = config.get('queries', self.DEFAULT_QUERIES)
+        self.cache_ttl = config.get('cache_ttl', self.DEFAULT_CACHE_TTL)
+        self.stream_results = config.get('stream_results', False)
+        self.batch_queries = config.get('batch_queries', True)
+        self.max_prompt_rows = config.get('max_prompt_rows', self.DEFAULT_MAX_PROMPT_ROWS)
         self.thresholds = config.get('thresholds', {
             'cpu_warning': 80,
             'mem_warning': 90,
             'disk_warning': 15
         })
         
+        self._prompt_template = self.PROMPT_TEMPLATE.format(
+            raw_data_text='{raw_data_text}',
+            cpu_warning=self.thresholds['cpu_warning'],
+            mem_warning=self.thresholds['mem_warning'],
+            disk_warning=self.thresholds['disk_warning']
+        )
+        
         if not self.openai_api_key:
             raise ValueError("OpenAI API key is required for Prometheus inspection")
         
-        self.openai_client = OpenAI(api_key=self.openai_api_key)
+        if self.stream_results and ijson is None:
+            raise ValueError("The ijson package is required when stream_results is enabled")
+        
+        self.openai_client = AsyncOpenAI(api_key=self.openai_api_key)
+        # Event loop used by the synchronous wrappers, created on first use
+        self._loop = None
+        
+        # Reuse one pooled, retrying session so queries share keep-alive connections
+        self.session = http_utils.create_session(pool_connections=8, pool_maxsize=16)
+        
+        # Docker client is created on first container lookup and reused after that
+        self._docker = None
+        self._container_urls = {}  # container_name -> (expires_at, prometheus_url)
+        
+        # Shaped rows keyed by (prometheus_url, metric_name, query) -> (expires_at, (rows, text))
+        self._query_cache = {}
+        self._query_cache_lock = threading.Lock()
         
     def get_container_ip(self, container_name):
         """
@@ -56,16 +160,28 @@ class PrometheusInspector:
         Returns:
             str: Prometheus URL with container IP
         """
+        cached = self._container_urls.get(container_name)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
         try:
-            cmd = f"docker inspect -f '{{{{range .NetworkSettings.Networks}}}}{{{{.IPAddress}}}}{{{{end}}}}' {container_name}"
-            ip = subprocess.check_output(cmd, shell=True).decode().strip()
+            if self._docker is None:
+                # Optional dependency, only needed when Prometheus is located by container name
+                import docker
+                self._docker = docker.from_env()
+            networks = self._docker.containers.get(container_name).attrs['NetworkSettings']['Networks']
+            ip = next((net['IPAddress'] for net in networks.values() if net.get('IPAddress')), None)
             if not ip:
                 raise ValueError(f"Could not find IP for container: {container_name}")
             prometheus_url = f"http://{ip}:9090"
-            logger.info(f"Found Prometheus container at {prometheus_url}")
+            logger.info("Found Prometheus container at %s", prometheus_url)
+            self._container_urls[container_name] = (time.monotonic() + self.CONTAINER_IP_TTL, prometheus_url)
             return prometheus_url
+        except ImportError:
+            logger.error("Error getting container IP: the docker package is required to look up containers")
+            return None
         except Exception as e:
-            logger.error(f"Error getting container IP: {e}")
+            logger.error("Error getting container IP: %s", e)
             return None
     
     def get_prometheus_url(self):
@@ -82,72 +198,353 @@ class PrometheusInspector:
         else:
             raise ValueError("Either prometheus_url or container_name must be specified in configuration")
     
-    def fetch_prometheus_data(self, prometheus_url):
+    def clear_cache(self):
+        """Drop all cached Prometheus query results."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+    
+    def _iter_results(self, prometheus_url, query, timeout=QUERY_TIMEOUT):
+        """
+        Run a Prometheus instant query and yield its result series.
+        
+        With stream_results enabled the response body is parsed incrementally,
+        so only one series is held in memory at a time.
+        
+        Args:
+            prometheus_url (str): Base URL of Prometheus server
+            query (str): PromQL query string
+            timeout (float): Request timeout in seconds
+            
+        Yields:
+            dict: Result series with 'metric' labels and a 'value' pair
+        """
+        url = f"{prometheus_url}/api/v1/query"
+        
+        if self.stream_results:
+            with self.session.get(url, params={'query': query}, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                # Let urllib3 undo any gzip encoding before ijson sees the bytes
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, 'data.result.item')
+        else:
+            response = self.session.get(url, params={'query': query}, timeout=timeout)
+            response.raise_for_status()
+            yield from http_utils.json_loads(response.content).get('data', {}).get('result', [])
+    
+    def _get_cached(self, key, force_refresh=False):
+        """
+        Look up a cached query result that is still fresh.
+        
+        Args:
+            key (tuple): Cache key
+            force_refresh (bool): Ignore any cached result
+            
+        Returns:
+            The cached value, or None on a miss
+        """
+        if not self.cache_ttl or force_refresh:
+            return None
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+    
+    def _set_cached(self, key, value):
+        """
+        Store a query result for cache_ttl seconds.
+        
+        Args:
+            key (tuple): Cache key
+            value: Value to cache
+        """
+        if self.cache_ttl:
+            with self._query_cache_lock:
+                self._query_cache[key] = (time.monotonic() + self.cache_ttl, value)
+    
+    def _get_formatter(self, metric_name):
+        """
+        Get the display formatter for a metric.
+        
+        Args:
+            metric_name (str): Name of the metric
+            
+        Returns:
+            callable: Formatter taking (series labels, value)
+        """
+        return self._FORMATTERS.get(metric_name) or (lambda labels, value: f"{metric_name}: {value:.2f}")
+    
+    def _query_metric(self, prometheus_url, metric_name, query, force_refresh=False):
+        """
+        Run a single Prometheus query and shape its results into report rows.
+        
+        Rows are reused from the cache while they are younger than cache_ttl.
+        
+        Args:
+            prometheus_url (str): Base URL of Prometheus server
+            metric_name (str): Name of the metric being queried
+            query (str): PromQL query string
+            force_refresh (bool): Ignore any cached result and query again
+            
+        Returns:
+            tuple: (list of MetricRow entries, their display lines joined as text)
+        """
+        key = (prometheus_url, metric_name, query)
+        cached = self._get_cached(key, force_refresh)
+        if cached is not None:
+            logger.debug("Using cached Prometheus result for metric: %s", metric_name)
+            return cached
+        
+        fmt = self._get_formatter(metric_name)
+        
+        rows = []
+        display_lines = []
+        for res in self._iter_results(prometheus_url, query):
+            metric = res['metric']
+            instance = metric.get('instance', 'unknown')
+            value = float(res['value'][1])
+            display = f"[{instance}] {fmt(metric, value)}"
+            rows.append(MetricRow(instance, metric_name, value, display))
+            display_lines.append(display)
+        
+        result = (rows, "\n".join(display_lines))
+        self._set_cached(key, result)
+        
+        logger.info("Fetched %s results for metric: %s", len(rows), metric_name)
+        return result
+    
+    def build_batch_query(self):
+        """
+        Combine all configured queries into a single PromQL expression.
+        
+        Each sub-query is tagged with a BATCH_LABEL label naming its metric, and
+        the tagged vectors are joined with 'or'. Because the tag makes every
+        label set distinct, the union keeps all series from every sub-query.
+        
+        Returns:
+            str: Combined PromQL expression
+        """
+        return " or ".join(
+            f'label_replace(({query}), "{self.BATCH_LABEL}", "{metric_name}", "", "")'
+            for metric_name, query in self.queries.items()
+        )
+    
+    def _query_batch(self, prometheus_url, force_refresh=False):
+        """
+        Fetch every configured metric with one Prometheus request.
+        
+        Args:
+            prometheus_url (str): Base URL of Prometheus server
+            force_refresh (bool): Ignore any cached result and query again
+            
+        Returns:
+            dict: Metric name -> (list of MetricRow entries, display text)
+        """
+        query = self.build_batch_query()
+        key = (prometheus_url, self.BATCH_LABEL, query)
+        cached = self._get_cached(key, force_refresh)
+        if cached is not None:
+            logger.debug("Using cached Prometheus result for batched query")
+            return cached
+        
+        formatters = {metric_name: self._get_formatter(metric_name) for metric_name in self.queries}
+        rows_by_metric = {metric_name: [] for metric_name in self.queries}
+        lines_by_metric = {metric_name: [] for metric_name in self.queries}
+        
+        for res in self._iter_results(prometheus_url, query, timeout=self.BATCH_QUERY_TIMEOUT):
+            metric = res['metric']
+            metric_name = metric.get(self.BATCH_LABEL)
+            if metric_name not in formatters:
+                continue
+            instance = metric.get('instance', 'unknown')
+            value = float(res['value'][1])
+            display = f"[{instance}] {formatters[metric_name](metric, value)}"
+            rows_by_metric[metric_name].append(MetricRow(instance, metric_name, value, display))
+            lines_by_metric[metric_name].append(display)
+        
+        result = {
+            metric_name: (rows, "\n".join(lines_by_metric[metric_name]))
+            for metric_name, rows in rows_by_metric.items()
+        }
+        self._set_cached(key, result)
+        
+        logger.info("Fetched %s results for %s metrics in one batched query",
+                    sum(len(rows) for rows in rows_by_metric.values()), len(self.queries))
+        return result
+    
+    def fetch_prometheus_data(self, prometheus_url, force_refresh=False):
         """
         Fetch metrics data from Prometheus API.
         
+        Synchronous wrapper around fetch_prometheus_data_async.
+        
         Args:
             prometheus_url (str): Base URL of Prometheus server
+            force_refresh (bool): Bypass cached results and query Prometheus again
             
         Returns:
-            list: List of metric data strings
+            tuple: (list of MetricRow entries, formatted text for the AI prompt)
         """
-        report_data = []
+        return self._run_sync(self.fetch_prometheus_data_async(prometheus_url, force_refresh))
+    
+    async def fetch_prometheus_data_async(self, prometheus_url, force_refresh=False):
+        """
+        Fetch metrics data from Prometheus API as a coroutine.
         
-        for metric_name, query in self.queries.items():
+        With batch_queries enabled all metrics are fetched in one request; if
+        that request fails, or batching is disabled, the configured queries are
+        issued concurrently over the shared session instead. A failed batched
+        request turns batching off for the rest of the inspector's life. Results younger
+        than cache_ttl seconds are served from memory. The
+        prompt text is assembled from display lines built while shaping rows,
+        so the rows are not walked a second time.
+        
+        Args:
+            prometheus_url (str): Base URL of Prometheus server
+            force_refresh (bool): Bypass cached results and query Prometheus again
+            
+        Returns:
+            tuple: (list of MetricRow entries, formatted text for the AI prompt)
+        """
+        loop = asyncio.get_running_loop()
+        metric_names = list(self.queries)
+        results = None
+        
+        if self.batch_queries and len(metric_names) > 1:
             try:
-                url = f"{prometheus_url}/api/v1/query"
-                response = requests.get(url, params={'query': query}, timeout=10)
-                response.raise_for_status()
-                
-                results = response.json().get('data', {}).get('result', [])
-                
-                for res in results:
-                    instance = res['metric'].get('instance', 'unknown')
-                    value = float(res['value'][1])
-                    
-                    if metric_name == "cpu_usage":
-                        val_str = f"Avg CPU Usage: {value:.2f}%"
-                    elif metric_name == "mem_usage":
-                        val_str = f"Max Mem Usage: {value:.2f}%"
-                    elif metric_name == "disk_free":
-                        mount = res['metric'].get('mountpoint', '/')
-                        val_str = f"Min Disk Free ({mount}): {value:.2f}%"
-                    else:
-                        val_str = f"{metric_name}: {value:.2f}"
-                    
-                    report_data.append({
-                        'instance': instance,
-                        'metric': metric_name,
-                        'value': value,
-                        'display': f"[{instance}] {val_str}"
-                    })
-                    
-                logger.info(f"Fetched {len(results)} results for metric: {metric_name}")
-                
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error fetching {metric_name} from Prometheus: {e}")
+                batched = await loop.run_in_executor(None, self._query_batch, prometheus_url, force_refresh)
+                results = [batched[metric_name] for metric_name in metric_names]
             except Exception as e:
-                logger.error(f"Unexpected error processing {metric_name}: {e}")
+                # Don't pay for the failing request (and its retries) on every later fetch
+                self.batch_queries = False
+                logger.warning("Batched Prometheus query failed, querying metrics individually from now on: %s", e)
+        
+        if results is None:
+            results = await asyncio.gather(*[
+                loop.run_in_executor(None, self._query_metric, prometheus_url, metric_name, query, force_refresh)
+                for metric_name, query in self.queries.items()
+            ], return_exceptions=True)
         
-        return report_data
+        # Results follow the configured query order regardless of completion order
+        report_data = []
+        text_blocks = []
+        for metric_name, result in zip(metric_names, results):
+            if isinstance(result, requests.exceptions.RequestException):
+                logger.error("Error fetching %s from Prometheus: %s", metric_name, result)
+            elif isinstance(result, Exception):
+                logger.error("Unexpected error processing %s: %s", metric_name, result)
+            elif result[0]:
+                report_data.extend(result[0])
+                text_blocks.append(result[1])
+        
+        formatted_data = "\n".join(text_blocks) if text_blocks else self.NO_DATA_TEXT
+        return report_data, formatted_data
     
-    def format_data_for_ai(self, raw_data):
+    def _is_notable(self, metric_name, p10):
         """
-        Format raw metric data for AI consumption.
+        Build a predicate selecting values worth listing individually.
+        
+        Risky values cross the configured thresholds; CPU and memory usage in
+        the bottom decile or under WASTE_CUTOFFS marks resource-waste candidates.
         
         Args:
-            raw_data (list): List of metric data dictionaries
+            metric_name (str): Name of the metric
+            p10 (float): 10th percentile of the metric's values
             
         Returns:
-            str: Formatted text for AI prompt
+            callable: Predicate taking a metric value
         """
-        if not raw_data:
-            return "No data collected from Prometheus."
+        if metric_name == "cpu_usage":
+            limit = self.thresholds['cpu_warning']
+            cutoff = self.WASTE_CUTOFFS[metric_name]
+            return lambda value: value > limit or value <= p10 or value < cutoff
+        if metric_name == "mem_usage":
+            limit = self.thresholds['mem_warning']
+            cutoff = self.WASTE_CUTOFFS[metric_name]
+            return lambda value: value > limit or value <= p10 or value < cutoff
+        if metric_name == "disk_free":
+            limit = self.thresholds['disk_warning']
+            return lambda value: value < limit
+        return lambda value: value <= p10
+    
+    def summarize_for_ai(self, raw_data):
+        """
+        Condense metric rows for large fleets before they are sent to the AI.
+        
+        Instances crossing a threshold or flagged as resource waste keep their
+        full line, and an instance flagged on CPU or memory keeps both lines so
+        the AI can report it once with both values. The rest of each metric
+        collapses into one line with its own median and 95th percentile.
+        
+        Args:
+            raw_data (list): List of MetricRow entries
+            
+        Returns:
+            str: Condensed text for the AI prompt
+        """
+        rows_by_metric = {}
+        for row in raw_data:
+            rows_by_metric.setdefault(row.metric, []).append(row)
+        
+        predicates = {}
+        for metric_name, rows in rows_by_metric.items():
+            if len(rows) < 2:
+                continue
+            p10 = statistics.quantiles([row.value for row in rows], n=10)[0]
+            predicates[metric_name] = self._is_notable(metric_name, p10)
         
-        lines = [item['display'] for item in raw_data]
+        # Instances whose CPU and memory lines are both kept
+        paired = {
+            row.instance
+            for metric_name in self.WASTE_CUTOFFS if metric_name in predicates
+            for row in rows_by_metric[metric_name] if predicates[metric_name](row.value)
+        }
+        
+        lines = []
+        for metric_name, rows in rows_by_metric.items():
+            is_notable = predicates.get(metric_name)
+            if is_notable is None:
+                lines.extend(row.display for row in rows)
+                continue
+            
+            keep_paired = metric_name in self.WASTE_CUTOFFS
+            
+            normal = []
+            for row in rows:
+                if is_notable(row.value) or (keep_paired and row.instance in paired):
+                    lines.append(row.display)
+                else:
+                    normal.append(row)
+            
+            # Percentiles describe only the collapsed rows, not the ones listed above
+            if len(normal) < 2:
+                lines.extend(row.display for row in normal)
+                continue
+            
+            cuts = statistics.quantiles([row.value for row in normal], n=20)
+            lines.append(f"{metric_name}: {len(normal)} other instances within normal range "
+                         f"(p50={cuts[9]:.2f}, p95={cuts[18]:.2f})")
+        
+        logger.info("Condensed %s metric rows into %s prompt lines", len(raw_data), len(lines))
         return "\n".join(lines)
     
+    def _run_sync(self, coro):
+        """
+        Run a coroutine to completion on this inspector's own event loop.
+        
+        The async OpenAI client keeps its connections bound to the loop it was
+        first used on, so repeated synchronous calls must share one loop.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
     def get_ai_summary(self, raw_data_text):
         """
         Generate AI summary of system metrics.
@@ -158,48 +555,76 @@ class PrometheusInspector:
         Returns:
             str: AI-generated inspection report
         """
-        if not raw_data_text or raw_data_text == "No data collected from Prometheus.":
+        return self._run_sync(self.get_ai_summary_async(raw_data_text))
+    
+    async def get_ai_summary_async(self, raw_data_text, semaphore=None):
+        """
+        Generate AI summary of system metrics without blocking the event loop.
+        
+        Args:
+            raw_data_text (str): Formatted metric data text
+            semaphore (asyncio.Semaphore, optional): Caps concurrent OpenAI requests
+            
+        Returns:
+            str: AI-generated inspection report
+        """
+        if not raw_data_text or raw_data_text == self.NO_DATA_TEXT:
             return "No data collected from Prometheus. Please check container status and configuration."
         
-        thresholds = self.thresholds
-        prompt = f"""
-You are an expert SRE. Below is the system performance data for the past 7 days:
-
-{raw_data_text}
-
-Please provide a concise weekly inspection report in English with factual analysis only:
-1. Overall system health status (Normal/Warning/Critical).
-2. Highlight any instances with potential risks:
-   - CPU > {thresholds['cpu_warning']}%
-   - Memory > {thresholds['mem_warning']}%
-   - Disk free space < {thresholds['disk_warning']}%
-3. Identify instances with potential resource waste:
-   - List each server only once, with all its resource waste indicators on the same line
-   - Format: Server name — CPU usage: X%, Memory usage: Y% (indicate if very low)
-   - Focus on servers with very low average CPU usage (< 10-15%) and/or very low memory usage (< 20-30%)
-   - Do not create separate categories for the same server; combine all observations for each server into a single entry
-
-Use Markdown formatting with bullet points. Keep it professional and concise.
-This is a factual analysis report only - provide observations and data analysis, but do not include actionable suggestions or recommendations. Do not offer to generate additional documents or rulesets.
-"""
+        prompt = self._prompt_template.format(raw_data_text=raw_data_text)
         
         try:
-            response = self.openai_client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            if semaphore is not None:
+                async with semaphore:
+                    response = await self._create_completion(prompt)
+            else:
+                response = await self._create_completion(prompt)
             summary = response.choices[0].message.content
             logger.info("Successfully generated AI summary")
             return summary
             
         except Exception as e:
-            logger.error(f"Error generating AI summary: {e}")
+            logger.error("Error generating AI summary: %s", e)
             return f"Error generating AI summary: {str(e)}"
     
-    def run_inspection(self):
+    async def _create_completion(self, prompt):
+        """
+        Send a single-message chat completion request to OpenAI.
+        
+        Args:
+            prompt (str): Prompt text
+            
+        Returns:
+            ChatCompletion: OpenAI response
+        """
+        return await self.openai_client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}]
+        )
+    
+    def run_inspection(self, force_refresh=False):
         """
         Run the complete inspection process.
         
+        Args:
+            force_refresh (bool): Bypass cached Prometheus results
+            
+        Returns:
+            dict: Inspection report data
+        """
+        return self._run_sync(self.run_inspection_async(force_refresh=force_refresh))
+    
+    async def run_inspection_async(self, semaphore=None, force_refresh=False):
+        """
+        Run the complete inspection process as a coroutine.
+        
+        Use this (or gather_inspections) to run several inspectors concurrently
+        so their OpenAI round-trips overlap.
+        
+        Args:
+            semaphore (asyncio.Semaphore, optional): Caps concurrent OpenAI requests
+            force_refresh (bool): Bypass cached Prometheus results
+            
         Returns:
             dict: Inspection report data
         """
@@ -212,15 +637,16 @@ This is a factual analysis report only - provide observations and data analysis,
                 raise ValueError("Could not determine Prometheus URL")
             
             # Fetch metrics data
-            logger.info(f"Fetching data from {prometheus_url}")
-            raw_data = self.fetch_prometheus_data(prometheus_url)
+            logger.info("Fetching data from %s", prometheus_url)
+            raw_data, formatted_data = await self.fetch_prometheus_data_async(prometheus_url, force_refresh)
             
-            # Format data for AI
-            formatted_data = self.format_data_for_ai(raw_data)
+            # Keep the prompt size bounded on large fleets
+            if self.max_prompt_rows and len(raw_data) > self.max_prompt_rows:
+                formatted_data = self.summarize_for_ai(raw_data)
             
             # Generate AI summary
             logger.info("Generating AI summary")
-            ai_summary = self.get_ai_summary(formatted_data)
+            ai_summary = await self.get_ai_summary_async(formatted_data, semaphore)
             
             # Prepare report data
             report_data = {
@@ -235,6 +661,26 @@ This is a factual analysis report only - provide observations and data analysis,
             return report_data
             
         except Exception as e:
-            logger.error(f"Inspection failed: {e}", exc_info=True)
+            logger.error("Inspection failed: %s", e, exc_info=True)
             raise
 
+
+async def gather_inspections(inspectors, rate_limit_qpm=None):
+    """
+    Run several inspections concurrently on the caller's event loop.
+    
+    Args:
+        inspectors (list): PrometheusInspector instances to run
+        rate_limit_qpm (int, optional): OpenAI requests-per-minute budget used
+            to cap how many summaries are requested at once
+            
+    Returns:
+        list: Inspection report data for each inspector, in order
+    """
+    semaphore = None
+    if rate_limit_qpm:
+        semaphore = asyncio.Semaphore(max(1, rate_limit_qpm // 60))
+    
+    return await asyncio.gather(*[
+        inspector.run_inspection_async(semaphore) for inspector in inspectors
+    ])
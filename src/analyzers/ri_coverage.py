@@ -6,13 +6,68 @@ and generates reports on instance coverage status.
 """
 
 import logging
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from collections import defaultdict
 
-from ..utils import aws_utils, report_utils
+from ..utils import aws_utils
 
 logger = logging.getLogger(__name__)
 
+# aws_utils always sets 'end_date' on RI details
+_end_date_key = operator.itemgetter('end_date')
+
+# Map AWS region code to user-friendly name
+_REGION_NAME_MAP = {
+    # 美洲
+    'us-east-1': 'US East (N. Virginia)',
+    'us-east-2': 'US East (Ohio)',
+    'us-west-1': 'US West (N. California)',
+    'us-west-2': 'US West (Oregon)',
+    'ca-central-1': 'Canada (Central)',
+    'ca-west-1': 'Canada West (Calgary)',
+    'sa-east-1': 'South America (São Paulo)',
+
+    # 欧洲
+    'eu-north-1': 'Europe (Stockholm)',
+    'eu-west-1': 'Europe (Ireland)',
+    'eu-west-2': 'Europe (London)',
+    'eu-west-3': 'Europe (Paris)',
+    'eu-central-1': 'Europe (Frankfurt)',
+    'eu-central-2': 'Europe (Zurich)',
+    'eu-south-1': 'Europe (Milan)',
+    'eu-south-2': 'Europe (Spain)',
+
+    # 亚太地区
+    'ap-east-1': 'Asia Pacific (Hong Kong)',
+    'ap-south-1': 'Asia Pacific (Mumbai)',
+    'ap-south-2': 'Asia Pacific (Hyderabad)',
+    'ap-northeast-1': 'Asia Pacific (Tokyo)',
+    'ap-northeast-2': 'Asia Pacific (Seoul)',
+    'ap-northeast-3': 'Asia Pacific (Osaka)',
+    'ap-southeast-1': 'Asia Pacific (Singapore)',
+    'ap-southeast-2': 'Asia Pacific (Sydney)',
+    'ap-southeast-3': 'Asia Pacific (Jakarta)',
+    'ap-southeast-4': 'Asia Pacific (Melbourne)',
+
+    # 中东和非洲
+    'me-south-1': 'Middle East (Bahrain)',
+    'me-central-1': 'Middle East (UAE)',
+    'af-south-1': 'Africa (Cape Town)',
+
+    # 中国
+    'cn-north-1': 'China (Beijing)',
+    'cn-northwest-1': 'China (Ningxia)',
+
+    # AWS GovCloud
+    'us-gov-east-1': 'AWS GovCloud (US-East)',
+    'us-gov-west-1': 'AWS GovCloud (US-West)',
+
+    # 以色列
+    'il-central-1': 'Israel (Tel Aviv)'
+}
+
 class RICoverageAnalyzer:
     """Analyzes EC2 Reserved Instance coverage and provides statistics."""
     
@@ -29,6 +84,20 @@ class RICoverageAnalyzer:
         self.aws_config = config.get('aws', {})
         self.profile = self.aws_config.get('profile')
     
+    def _ec2_client(self, region):
+        """
+        Get the EC2 client for a region.
+        
+        aws_utils caches clients, so both lookups for a region share one.
+        
+        Args:
+            region (str): AWS region name
+            
+        Returns:
+            boto3.client: EC2 client for the region
+        """
+        return aws_utils.get_aws_client('ec2', region=region, profile=self.profile)
+    
     def get_running_instances(self, region):
         """
         Get current running EC2 instances in the specified region.
@@ -39,8 +108,8 @@ class RICoverageAnalyzer:
         Returns:
             dict: Running EC2 instances grouped by instance type
         """
-        ec2_client = aws_utils.get_aws_client('ec2', region=region, profile=self.profile)
-        logger.info(f"Fetching running instances in region {region}")
+        ec2_client = self._ec2_client(region)
+        logger.info("Fetching running instances in region %s", region)
         
         return aws_utils.get_running_ec2_instances(ec2_client)
     
@@ -54,8 +123,8 @@ class RICoverageAnalyzer:
         Returns:
             dict: Active reserved instances grouped by instance type
         """
-        ec2_client = aws_utils.get_aws_client('ec2', region=region, profile=self.profile)
-        logger.info(f"Fetching reserved instances in region {region}")
+        ec2_client = self._ec2_client(region)
+        logger.info("Fetching reserved instances in region %s", region)
         
         return aws_utils.get_reserved_ec2_instances(ec2_client)
     
@@ -76,42 +145,35 @@ class RICoverageAnalyzer:
         
         # Find the soonest expiring RI
         soonest_expiry = None
-        if ri_details:
-            # Sort by end_date and get the first one
-            sorted_ris = sorted(ri_details, key=lambda x: x.get('end_date', '9999-12-31'))
-            if sorted_ris:
-                soonest_expiry = {
-                    'type': sorted_ris[0].get('type'),
-                    'date': sorted_ris[0].get('end_date'),
-                    'id': sorted_ris[0].get('id')
-                }
-        
-        # Count running instances by type
-        running_counts = {instance_type: len(instances) for instance_type, instances in running_instances.items()}
+        soonest = min(ri_details, key=_end_date_key, default=None)
+        if soonest:
+            soonest_expiry = {
+                'type': soonest.get('type'),
+                'date': soonest.get('end_date'),
+                'id': soonest.get('id')
+            }
         
-        # Calculate total counts
-        total_running = sum(running_counts.values())
         total_reserved = sum(ri_counts.values())
         
-        # Calculate covered and uncovered instances
-        covered_counts = {}
-        uncovered_counts = {}
+        # Count running, covered and uncovered instances in a single pass
+        running_counts = {}
         uncovered_instances = {}
+        total_running = 0
+        total_covered = 0
         
-        for instance_type, count in running_counts.items():
+        for instance_type, instances in running_instances.items():
+            count = len(instances)
             ri_available = ri_counts.get(instance_type, 0)
-            covered = min(count, ri_available)
-            uncovered = count - covered
+            running_counts[instance_type] = count
+            total_running += count
             
-            covered_counts[instance_type] = covered
-            
-            if uncovered > 0:
-                uncovered_counts[instance_type] = uncovered
-                uncovered_instances[instance_type] = uncovered
+            if count > ri_available:
+                total_covered += ri_available
+                uncovered_instances[instance_type] = count - ri_available
+            else:
+                total_covered += count
         
-        # Calculate total covered and uncovered
-        total_covered = sum(covered_counts.values())
-        total_uncovered = sum(uncovered_counts.values())
+        total_uncovered = total_running - total_covered
         
         # Calculate coverage percentage
         coverage_percentage = (total_covered / total_running * 100) if total_running > 0 else 0
@@ -139,65 +201,20 @@ class RICoverageAnalyzer:
         Returns:
             dict: Region coverage data
         """
-        logger.info(f"Analyzing RI coverage for region: {region}")
+        logger.info("Analyzing RI coverage for region: %s", region)
         
-        running_instances = self.get_running_instances(region)
-        reserved_instances = self.get_reserved_instances(region)
-        coverage = self.calculate_coverage(running_instances, reserved_instances)
+        # The two lookups are independent, so issue them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            running_future = executor.submit(self.get_running_instances, region)
+            reserved_future = executor.submit(self.get_reserved_instances, region)
+            running_instances = running_future.result()
+            reserved_instances = reserved_future.result()
         
-        # Map AWS region code to user-friendly name
-        region_name_map = {
-            # 美洲
-            'us-east-1': 'US East (N. Virginia)',
-            'us-east-2': 'US East (Ohio)',
-            'us-west-1': 'US West (N. California)',
-            'us-west-2': 'US West (Oregon)',
-            'ca-central-1': 'Canada (Central)',
-            'ca-west-1': 'Canada West (Calgary)',
-            'sa-east-1': 'South America (São Paulo)',
-            
-            # 欧洲
-            'eu-north-1': 'Europe (Stockholm)',
-            'eu-west-1': 'Europe (Ireland)',
-            'eu-west-2': 'Europe (London)',
-            'eu-west-3': 'Europe (Paris)',
-            'eu-central-1': 'Europe (Frankfurt)',
-            'eu-central-2': 'Europe (Zurich)',
-            'eu-south-1': 'Europe (Milan)',
-            'eu-south-2': 'Europe (Spain)',
-            
-            # 亚太地区
-            'ap-east-1': 'Asia Pacific (Hong Kong)',
-            'ap-south-1': 'Asia Pacific (Mumbai)',
-            'ap-south-2': 'Asia Pacific (Hyderabad)',
-            'ap-northeast-1': 'Asia Pacific (Tokyo)',
-            'ap-northeast-2': 'Asia Pacific (Seoul)',
-            'ap-northeast-3': 'Asia Pacific (Osaka)',
-            'ap-southeast-1': 'Asia Pacific (Singapore)',
-            'ap-southeast-2': 'Asia Pacific (Sydney)',
-            'ap-southeast-3': 'Asia Pacific (Jakarta)',
-            'ap-southeast-4': 'Asia Pacific (Melbourne)',
-            
-            # 中东和非洲
-            'me-south-1': 'Middle East (Bahrain)',
-            'me-central-1': 'Middle East (UAE)',
-            'af-south-1': 'Africa (Cape Town)',
-            
-            # 中国
-            'cn-north-1': 'China (Beijing)',
-            'cn-northwest-1': 'China (Ningxia)',
-            
-            # AWS GovCloud
-            'us-gov-east-1': 'AWS GovCloud (US-East)',
-            'us-gov-west-1': 'AWS GovCloud (US-West)',
-            
-            # 以色列
-            'il-central-1': 'Israel (Tel Aviv)'
-        }
+        coverage = self.calculate_coverage(running_instances, reserved_instances)
         
         return {
             'region': region,
-            'region_name': region_name_map.get(region, region),
+            'region_name': _REGION_NAME_MAP.get(region, region),
             **coverage
         }
     
@@ -219,8 +236,17 @@ class RICoverageAnalyzer:
             }
         }
         
-        for region in self.regions:
-            region_data = self.analyze_region(region)
+        region_results = []
+        if self.regions:
+            # Regions are analyzed concurrently; results keep the configured order
+            with ThreadPoolExecutor(max_workers=min(len(self.regions), 16)) as executor:
+                region_results = list(executor.map(self.analyze_region, self.regions))
+        
+        # Running minimum of the soonest expiring RI across all regions
+        soonest_region = None
+        soonest_date = '9999-99-99'
+        
+        for region_data in region_results:
             report['regions_data'].append(region_data)
             
             # Update summary
@@ -228,15 +254,17 @@ class RICoverageAnalyzer:
             report['summary']['total_reserved_instances'] += region_data['total_reserved_instances']
             report['summary']['total_uncovered_instances'] += region_data['uncovered_instances']
             
-            # Keep track of the soonest expiring RI across all regions
-            if region_data.get('soonest_expiring_ri') and (
-                not report['summary']['soonest_expiring_ri'] or 
-                region_data['soonest_expiring_ri']['date'] < report['summary']['soonest_expiring_ri']['date']):
-                report['summary']['soonest_expiring_ri'] = {
-                    **region_data['soonest_expiring_ri'],
-                    'region': region,
-                    'region_name': region_data['region_name']
-                }
+            soonest = region_data['soonest_expiring_ri']
+            if soonest and soonest['date'] < soonest_date:
+                soonest_region = region_data
+                soonest_date = soonest['date']
+        
+        if soonest_region:
+            report['summary']['soonest_expiring_ri'] = {
+                **soonest_region['soonest_expiring_ri'],
+                'region': soonest_region['region'],
+                'region_name': soonest_region['region_name']
+            }
         
         # Calculate overall coverage percentage
         total_instances = report['summary']['total_instances']
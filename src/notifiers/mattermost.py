@@ -5,13 +5,54 @@ This module handles sending notifications to Mattermost channels
 through webhook integrations.
 """
 
-import json
 import logging
-import requests
-from datetime import datetime
+from collections import OrderedDict
+
+from ..utils import http_utils
 
 logger = logging.getLogger(__name__)
 
+# Mattermost rejects or splits posts longer than this many characters
+MAX_MESSAGE_LENGTH = 16000
+
+# Separator placed between reports combined into one post
+BATCH_SEPARATOR = "\n\n---\n\n"
+
+# Number of formatted RI messages kept for re-sends
+MESSAGE_CACHE_SIZE = 16
+
+# Static blocks and row templates of the RI coverage message
+_DEFAULT_TITLE = "### DevOps Notification\n\n"
+_SUMMARY_HEADER = (
+    "#### EC2 Reserved Instance Coverage Report\n"
+    "| Metric | Value |\n"
+    "|--------|-------|\n"
+)
+_REGION_TABLE_HEADER = (
+    "#### Region Details\n"
+    "| Region | Running | RIs | Uncovered | Coverage |\n"
+    "|--------|---------|-----|-----------|----------|\n"
+)
+_REGION_ROW_FMT = "| %s | %s | %s | %s | %s %.1f%% |\n"
+
+# Coverage status icons, checked from the highest minimum percentage down
+_STATUS_ICONS = ((80, "✅"), (50, "⚠️"))
+
+def _status_icon(coverage):
+    """
+    Get the status icon for a coverage percentage.
+    
+    Args:
+        coverage (float): Coverage percentage
+        
+    Returns:
+        str: Status emoji
+    """
+    for minimum, icon in _STATUS_ICONS:
+        if coverage >= minimum:
+            return icon
+    return "❌"
+
 class MattermostNotifier:
     """Sends notifications to Mattermost channels."""
     
@@ -28,11 +69,29 @@ class MattermostNotifier:
         self.username = config.get('username', 'AWS Resource Optimizer')
         self.icon_emoji = config.get('icon_emoji', ':money_with_wings:')
         self.enabled = config.get('enabled', True)
+        self.batch_reports = config.get('batch_reports', True)
+        
+        # Formatted reports waiting for flush()
+        self._pending = []
+        
+        # Most recently formatted RI messages, keyed on report timestamp and content
+        self._msg_cache = OrderedDict()
+        
+        # Pooled session that retries transient webhook failures; the webhook only takes POSTs.
+        # Read timeouts are not retried, since the post may already be in the channel.
+        self.session = http_utils.create_session(pool_connections=4, pool_maxsize=8, backoff_factor=0.3,
+                                                 allowed_methods=('POST',), read_retries=0)
+    
+    def close(self):
+        """Release the pooled webhook connections."""
+        self.session.close()
     
     def format_ri_coverage_message(self, report_data):
         """
         Format RI coverage analysis data into a Mattermost message.
-        Only include summary information.
+        Only include summary information. The last MESSAGE_CACHE_SIZE messages
+        are cached by report timestamp and figures, so formatting the same
+        report again is a lookup.
         
         Args:
             report_data (dict): The RI coverage report data
@@ -40,8 +99,11 @@ class MattermostNotifier:
         Returns:
             str: Formatted text message
         """
-        # Convert timestamp to readable format
-        timestamp = datetime.fromisoformat(report_data['timestamp']).strftime('%Y-%m-%d %H:%M UTC')
+        cache_key = self._message_cache_key(report_data)
+        cached = self._msg_cache.get(cache_key)
+        if cached is not None:
+            self._msg_cache.move_to_end(cache_key)
+            return cached
         
         # Get summary data
         summary = report_data.get('summary', {})
@@ -53,54 +115,94 @@ class MattermostNotifier:
         # Get soonest expiring RI info
         soonest_ri = summary.get('soonest_expiring_ri')
         
-        # Determine status icon based on coverage percentage
-        status_icon = "✅" if overall_coverage >= 80 else "⚠️" if overall_coverage >= 50 else "❌"
-        
         # Build a nicely formatted message
-        if self.config.get('title'):
-            text = self.config['title']
-        else:
-            text = "### DevOps Notification\n\n"
+        parts = [self.config.get('title') or _DEFAULT_TITLE]
         
         # Summary section with highlighting
-        text += "#### EC2 Reserved Instance Coverage Report\n"
-        text += f"| Metric | Value |\n"
-        text += f"|--------|-------|\n"
-        text += f"| Running EC2 Instances | **{total_instances}** |\n"
-        text += f"| Active Reserved Instances | **{total_ris}** |\n"
-        text += f"| Uncovered Instances | **{total_uncovered}** |\n"
-        text += f"| Overall Coverage | {status_icon} **{overall_coverage:.1f}%** |\n"
+        parts.append(_SUMMARY_HEADER)
+        parts.append(f"| Running EC2 Instances | **{total_instances}** |\n")
+        parts.append(f"| Active Reserved Instances | **{total_ris}** |\n")
+        parts.append(f"| Uncovered Instances | **{total_uncovered}** |\n")
+        parts.append(f"| Overall Coverage | {_status_icon(overall_coverage)} **{overall_coverage:.1f}%** |\n")
         
         # Add soonest expiring RI if available
         if soonest_ri:
-            text += f"| Next RI Expiry | ⏰ **{soonest_ri['type']}** in **{soonest_ri['region_name']}** on **{soonest_ri['date']}** |\n\n"
+            parts.append(f"| Next RI Expiry | ⏰ **{soonest_ri['type']}** in **{soonest_ri['region_name']}** on **{soonest_ri['date']}** |\n\n")
         else:
-            text += f"| Next RI Expiry | No active RIs |\n\n"
+            parts.append("| Next RI Expiry | No active RIs |\n\n")
         
         # Add region details in a table format
-        text += "#### Region Details\n"
-        text += "| Region | Running | RIs | Uncovered | Coverage |\n"
-        text += "|--------|---------|-----|-----------|----------|\n"
+        parts.append(_REGION_TABLE_HEADER)
         
         for region_data in report_data.get('regions_data', []):
-            region_name = region_data.get('region_name', region_data.get('region'))
-            region_instances = region_data.get('total_instances', 0)
-            region_ris = region_data.get('total_reserved_instances', 0)
-            region_uncovered = region_data.get('uncovered_instances', 0)
-            region_coverage = region_data.get('coverage_percentage', 0)
+            get = region_data.get
+            region_instances = get('total_instances', 0)
             
             # Only include regions with instances
-            if region_instances > 0:
-                region_status = "✅" if region_coverage >= 80 else "⚠️" if region_coverage >= 50 else "❌"
-                text += f"| {region_name} | {region_instances} | {region_ris} | {region_uncovered} | {region_status} {region_coverage:.1f}% |\n"
+            if region_instances <= 0:
+                continue
+            
+            region_coverage = get('coverage_percentage', 0)
+            parts.append(_REGION_ROW_FMT % (
+                get('region_name') or get('region'),
+                region_instances,
+                get('total_reserved_instances', 0),
+                get('uncovered_instances', 0),
+                _status_icon(region_coverage),
+                region_coverage,
+            ))
         
         # Add additional info from configuration if available
         if self.config.get('additional_info'):
-            text += f"\n\n{self.config['additional_info']}\n"
+            parts.append(f"\n\n{self.config['additional_info']}\n")
         
+        text = "".join(parts)
+        self._msg_cache[cache_key] = text
+        if len(self._msg_cache) > MESSAGE_CACHE_SIZE:
+            self._msg_cache.popitem(last=False)
         logger.debug("Formatted enhanced message for Mattermost")
         return text
     
+    @staticmethod
+    def _message_cache_key(report_data):
+        """
+        Build the message cache key for a report from the fields the message shows.
+        
+        Reports stamped with the same run time (e.g. one per account) differ
+        in their figures, so those are part of the key along with the timestamp.
+        
+        Args:
+            report_data (dict): The RI coverage report data
+            
+        Returns:
+            tuple: Hashable key identifying the formatted message
+        """
+        summary = report_data.get('summary', {})
+        soonest_ri = summary.get('soonest_expiring_ri')
+        if soonest_ri:
+            soonest_ri = (soonest_ri.get('type'), soonest_ri.get('region_name'), soonest_ri.get('date'))
+        
+        regions = tuple(
+            (
+                region_data.get('region_name') or region_data.get('region'),
+                region_data.get('total_instances', 0),
+                region_data.get('total_reserved_instances', 0),
+                region_data.get('uncovered_instances', 0),
+                region_data.get('coverage_percentage', 0),
+            )
+            for region_data in report_data.get('regions_data', [])
+        )
+        
+        return (
+            report_data.get('timestamp'),
+            summary.get('total_instances', 0),
+            summary.get('total_reserved_instances', 0),
+            summary.get('total_uncovered_instances', 0),
+            summary.get('overall_coverage_percentage', 0),
+            soonest_ri,
+            regions,
+        )
+    
     def send_notification(self, message_text):
         """
         Send a notification to the configured Mattermost channel.
@@ -115,48 +217,29 @@ class MattermostNotifier:
             logger.info("Mattermost notifications are disabled in configuration")
             return False
             
-        logger.info(f"Sending notification to Mattermost channel: {self.channel}")
+        logger.info("Sending notification to Mattermost channel: %s", self.channel)
         
         try:
-            # Try the absolute simplest approach - plain text message
+            # Plain text message; transient failures are retried by the session
             payload = {"text": message_text}
             
-            # Log what we're sending
             logger.debug("Sending simple text message to Mattermost webhook")
             
-            # Make direct POST with minimal formatting
-            response = requests.post(self.webhook_url, 
-                                    data=json.dumps(payload),
-                                    headers={'Content-Type': 'application/json'})
+            response = self.session.post(self.webhook_url,
+                                         data=http_utils.json_dumps(payload),
+                                         headers={'Content-Type': 'application/json'},
+                                         timeout=(3.05, 10))
             
             # Check response
             if response.status_code == 200:
                 logger.info("Successfully sent notification to Mattermost")
                 return True
             else:
-                logger.error(f"Failed to send notification to Mattermost: {response.status_code} {response.text}")
-                
-                # Try curl equivalent approach as last resort
-                logger.debug("Trying curl equivalent approach")
-                
-                # Create a completely minimal payload string
-                curl_payload = '{"text":"' + message_text.replace('\n', '\\n').replace('"', '\\"') + '"}'
-                
-                curl_response = requests.post(
-                    self.webhook_url,
-                    data=curl_payload,
-                    headers={'Content-Type': 'application/json'}
-                )
-                
-                if curl_response.status_code == 200:
-                    logger.info("Successfully sent notification using curl equivalent")
-                    return True
-                else:
-                    logger.error(f"All methods failed: {curl_response.status_code} {curl_response.text}")
-                    return False
+                logger.error("Failed to send notification to Mattermost: %s %s", response.status_code, response.text)
+                return False
                 
         except Exception as e:
-            logger.error(f"Error sending notification to Mattermost: {str(e)}")
+            logger.error("Error sending notification to Mattermost: %s", e)
             return False
         
     def send_attachment(self, title, content, color="good", icon_emoji=None):
@@ -176,7 +259,7 @@ class MattermostNotifier:
             logger.info("Mattermost notifications are disabled in configuration")
             return False
         
-        logger.info(f"Sending formatted notification to Mattermost channel: {self.channel}")
+        logger.info("Sending formatted notification to Mattermost channel: %s", self.channel)
         
         # Map color names
         color_map = {
@@ -202,11 +285,11 @@ class MattermostNotifier:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
-                json=payload,
+                data=http_utils.json_dumps(payload),
                 headers={'Content-Type': 'application/json'},
-                timeout=10
+                timeout=(3.05, 10)
             )
             response.raise_for_status()
             
@@ -214,11 +297,11 @@ class MattermostNotifier:
                 logger.info("Successfully sent formatted notification to Mattermost")
                 return True
             else:
-                logger.error(f"Failed to send notification: {response.status_code} {response.text}")
+                logger.error("Failed to send notification: %s %s", response.status_code, response.text)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error sending formatted notification to Mattermost: {str(e)}")
+            logger.error("Error sending formatted notification to Mattermost: %s", e)
             return False
     
     def send_ri_report(self, report_data):
@@ -234,6 +317,68 @@ class MattermostNotifier:
         message_text = self.format_ri_coverage_message(report_data)
         return self.send_notification(message_text)
     
+    def queue_ri_report(self, report_data):
+        """
+        Format an RI coverage report and hold it until flush() is called.
+        
+        Args:
+            report_data (dict): The RI coverage report data
+        """
+        self._pending.append(self.format_ri_coverage_message(report_data))
+    
+    def flush(self):
+        """
+        Send all queued reports.
+        
+        With batch_reports enabled, queued reports are combined into as few
+        posts as fit within MAX_MESSAGE_LENGTH; otherwise each is sent on its own.
+        
+        Returns:
+            bool: True if every post was sent successfully, False otherwise
+        """
+        if not self._pending:
+            return True
+        
+        messages = self._pending
+        self._pending = []
+        
+        if self.batch_reports:
+            messages = self._combine_messages(messages)
+        
+        results = [self.send_notification(message) for message in messages]
+        return all(results)
+    
+    @staticmethod
+    def _combine_messages(messages):
+        """
+        Join messages into posts no longer than MAX_MESSAGE_LENGTH.
+        
+        A single message that is already over the limit is sent as its own post.
+        
+        Args:
+            messages (list): Message texts in send order
+            
+        Returns:
+            list: Combined message texts
+        """
+        combined = []
+        current = []
+        current_length = 0
+        
+        for message in messages:
+            added_length = len(message) + (len(BATCH_SEPARATOR) if current else 0)
+            if current and current_length + added_length > MAX_MESSAGE_LENGTH:
+                combined.append(BATCH_SEPARATOR.join(current))
+                current = []
+                current_length = 0
+                added_length = len(message)
+            current.append(message)
+            current_length += added_length
+        
+        if current:
+            combined.append(BATCH_SEPARATOR.join(current))
+        return combined
+    
     def send_prometheus_report(self, report_data):
         """
         Send a Prometheus inspection report notification with formatted attachment.
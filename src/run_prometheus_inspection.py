@@ -8,7 +8,6 @@ and sends notifications. Designed to run weekly.
 
 import os
 import sys
-import yaml
 import logging
 from datetime import datetime
 
@@ -21,7 +20,7 @@ LOG_DIR = os.path.join(BASE_DIR, "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 
 from src.analyzers.prometheus_inspector import PrometheusInspector
-from src.notifiers.mattermost import MattermostNotifier
+from src.utils.config import load_config
 
 # Configure logging
 logging.basicConfig(
@@ -35,35 +34,16 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-def load_config(config_path="config/settings.yaml"):
-    """
-    Load configuration from YAML file.
-    
-    Args:
-        config_path (str): Path to configuration file
-        
-    Returns:
-        dict: Configuration data
-    """
-    # Use absolute path for configuration file
-    if not os.path.isabs(config_path):
-        config_path = os.path.join(BASE_DIR, config_path)
-        
-    try:
-        with open(config_path, 'r') as config_file:
-            config = yaml.safe_load(config_file)
-        logger.info(f"Configuration loaded from {config_path}")
-        return config
-    except Exception as e:
-        logger.error(f"Failed to load configuration: {str(e)}")
-        sys.exit(1)
-
 def main():
     """Main execution function."""
     logger.info("Starting Prometheus System Inspection")
     
     # Load configuration
-    config = load_config()
+    try:
+        config = load_config()
+    except Exception as e:
+        logger.error("Failed to load configuration: %s", e)
+        sys.exit(1)
     
     try:
         # Initialize the Prometheus inspector
@@ -79,10 +59,14 @@ def main():
         
         # Send notification if enabled
         if config['notifications'].get('mattermost', {}).get('enabled', False):
+            # Imported here so runs without notifications skip loading the notifier module
+            from src.notifiers.mattermost import MattermostNotifier
+            
             notifier = MattermostNotifier(config['notifications']['mattermost'])
             
             # Send formatted Prometheus report
             success = notifier.send_prometheus_report(report_data)
+            notifier.close()
             
             if success:
                 logger.info("Successfully sent notification to Mattermost")
@@ -94,7 +78,7 @@ def main():
         logger.info("Inspection completed successfully")
         
     except Exception as e:
-        logger.error(f"Inspection failed: {str(e)}", exc_info=True)
+        logger.error("Inspection failed: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == "__main__":
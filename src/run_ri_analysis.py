@@ -7,7 +7,6 @@ It loads configuration, runs the analysis, generates reports, and sends notifica
 
 import os
 import sys
-import yaml
 import logging
 from datetime import datetime
 
@@ -20,7 +19,7 @@ LOG_DIR = os.path.join(BASE_DIR, "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 
 from src.analyzers.ri_coverage import RICoverageAnalyzer
-from src.notifiers.mattermost import MattermostNotifier
+from src.utils.config import load_config
 from src.utils import report_utils
 
 # Configure logging
@@ -35,35 +34,16 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-def load_config(config_path="config/settings.yaml"):
-    """
-    Load configuration from YAML file.
-    
-    Args:
-        config_path (str): Path to configuration file
-        
-    Returns:
-        dict: Configuration data
-    """
-    # Use absolute path for configuration file
-    if not os.path.isabs(config_path):
-        config_path = os.path.join(BASE_DIR, config_path)
-        
-    try:
-        with open(config_path, 'r') as config_file:
-            config = yaml.safe_load(config_file)
-        logger.info(f"Configuration loaded from {config_path}")
-        return config
-    except Exception as e:
-        logger.error(f"Failed to load configuration: {str(e)}")
-        sys.exit(1)
-
 def main():
     """Main execution function."""
     logger.info("Starting EC2 Reserved Instance Coverage Analysis")
     
     # Load configuration
-    config = load_config()
+    try:
+        config = load_config()
+    except Exception as e:
+        logger.error("Failed to load configuration: %s", e)
+        sys.exit(1)
     
     try:
         # Initialize the RI coverage analyzer
@@ -81,16 +61,21 @@ def main():
         
         # Send notification if enabled
         if config['notifications'].get('mattermost', {}).get('enabled', False):
+            # Imported here so runs without notifications skip the HTTP stack
+            from src.notifiers.mattermost import MattermostNotifier
+            
             notifier = MattermostNotifier(config['notifications']['mattermost'])
-            notifier.send_ri_report(report_data)
+            notifier.queue_ri_report(report_data)
+            notifier.flush()
+            notifier.close()
             
-        logger.info(f"Analysis complete. Report generated: {report_file}")
+        logger.info("Analysis complete. Report generated: %s", report_file)
         
         # Print report to console for immediate viewing
         print("\n" + markdown_content)
         
     except Exception as e:
-        logger.error(f"Analysis failed: {str(e)}", exc_info=True)
+        logger.error("Analysis failed: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == "__main__":
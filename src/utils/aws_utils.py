@@ -5,55 +5,116 @@ This module provides helper functions for interacting with AWS services.
 """
 
 import logging
+import threading
 import boto3
 import botocore.exceptions
-from collections import defaultdict
+import botocore.session
+from botocore.credentials import AssumeRoleCredentialFetcher, DeferredRefreshableCredentials
+from collections import Counter, defaultdict
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-def get_aws_client(service_name, region=None, profile=None, role_arn=None):
+# Guards the shared boto3 sessions, which are not safe for concurrent client creation
+_SESSION_LOCK = threading.Lock()
+
+# AWS clients keyed on (service, region, profile, role), filled under _SESSION_LOCK
+_CLIENTS = {}
+
+# Largest page DescribeInstances accepts, to keep round-trips down on big fleets
+DESCRIBE_INSTANCES_PAGE_SIZE = 1000
+
+@lru_cache(maxsize=16)
+def _get_session(profile=None, role_arn=None):
     """
-    Get an AWS service client with optional configuration.
+    Get a cached boto3 session for a profile, optionally assuming an IAM role.
+    
+    Assumed-role credentials are refreshed by botocore shortly before they
+    expire, so STS is called once per role rather than once per client.
     
     Args:
-        service_name (str): AWS service name (e.g., 'ec2', 'ce')
-        region (str, optional): AWS region name
         profile (str, optional): AWS profile name
         role_arn (str, optional): IAM role ARN to assume
         
     Returns:
-        boto3.client: Configured AWS service client
+        boto3.Session: Session for the profile and role
     """
-    session_kwargs = {}
-    client_kwargs = {}
+    source_session = boto3.Session(profile_name=profile)
+    if not role_arn:
+        return source_session
     
-    if profile:
-        session_kwargs['profile_name'] = profile
-        
-    session = boto3.Session(**session_kwargs)
+    fetcher = AssumeRoleCredentialFetcher(
+        client_creator=source_session._session.create_client,
+        source_credentials=source_session.get_credentials(),
+        role_arn=role_arn,
+        extra_args={'RoleSessionName': 'AWSResourceOptimizer'}
+    )
+    botocore_session = botocore.session.Session()
+    botocore_session._credentials = DeferredRefreshableCredentials(
+        method='assume-role',
+        refresh_using=fetcher.fetch_credentials
+    )
+    return boto3.Session(botocore_session=botocore_session, region_name=source_session.region_name)
+
+def _cached_client(service_name, region=None, profile=None, role_arn=None):
+    """
+    Create an AWS service client once per (service, region, profile, role).
     
-    # Handle role assumption if provided
-    if role_arn:
-        sts_client = session.client('sts')
-        assumed_role = sts_client.assume_role(
-            RoleArn=role_arn,
-            RoleSessionName='AWSResourceOptimizer'
-        )
-        credentials = assumed_role['Credentials']
+    boto3 clients are safe to share between threads, and assumed-role clients
+    refresh their own credentials, so cached clients never need rebuilding.
+    The lookup is repeated under the lock so that threads asking for the same
+    client at once still create only one.
+    
+    Args:
+        service_name (str): AWS service name
+        region (str, optional): AWS region name
+        profile (str, optional): AWS profile name
+        role_arn (str, optional): IAM role ARN to assume
         
-        client_kwargs['aws_access_key_id'] = credentials['AccessKeyId']
-        client_kwargs['aws_secret_access_key'] = credentials['SecretAccessKey']
-        client_kwargs['aws_session_token'] = credentials['SessionToken']
+    Returns:
+        boto3.client: AWS service client
+    """
+    key = (service_name, region, profile, role_arn)
+    client = _CLIENTS.get(key)
+    if client is not None:
+        return client
+    
+    client_kwargs = {}
     
     if region:
         client_kwargs['region_name'] = region
     
-    try:
+    # boto3 sessions are not thread-safe, so creation is serialized
+    with _SESSION_LOCK:
+        client = _CLIENTS.get(key)
+        if client is not None:
+            return client
+        session = _get_session(profile, role_arn)
         client = session.client(service_name, **client_kwargs)
-        logger.debug(f"Created AWS client for service: {service_name}")
-        return client
+        _CLIENTS[key] = client
+    logger.debug("Created AWS client for service: %s", service_name)
+    return client
+
+def get_aws_client(service_name, region=None, profile=None, role_arn=None):
+    """
+    Get an AWS service client with optional configuration.
+    
+    Clients are cached, so repeated calls with the same arguments return the
+    same client.
+    
+    Args:
+        service_name (str): AWS service name (e.g., 'ec2', 'ce')
+        region (str, optional): AWS region name
+        profile (str, optional): AWS profile name
+        role_arn (str, optional): IAM role ARN to assume
+        
+    Returns:
+        boto3.client: Configured AWS service client
+    """
+    try:
+        return _cached_client(service_name, region, profile, role_arn)
     except botocore.exceptions.ClientError as e:
-        logger.error(f"Failed to create AWS client for {service_name}: {str(e)}")
+        logger.error("Failed to create AWS client for %s: %s", service_name, e)
         raise
 
 def get_aws_accounts():
@@ -81,7 +142,13 @@ def get_running_ec2_instances(client):
         paginator = client.get_paginator('describe_instances')
         instance_type_count = defaultdict(list)
         
-        for page in paginator.paginate(Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]):
+        pages = paginator.paginate(
+            Filters=[{'Name': 'instance-state-name', 'Values': ['running']}],
+            PaginationConfig={'PageSize': DESCRIBE_INSTANCES_PAGE_SIZE}
+        )
+        
+        for page in pages:
+            logger.debug("Processing DescribeInstances page with %s reservations", len(page['Reservations']))
             for reservation in page['Reservations']:
                 for instance in reservation['Instances']:
                     instance_type = instance['InstanceType']
@@ -94,10 +161,10 @@ def get_running_ec2_instances(client):
                     })
         
         total_instances = sum(len(instances) for instances in instance_type_count.values())
-        logger.debug(f"Found {total_instances} running EC2 instances across {len(instance_type_count)} instance types")
+        logger.debug("Found %s running EC2 instances across %s instance types", total_instances, len(instance_type_count))
         return instance_type_count
     except botocore.exceptions.ClientError as e:
-        logger.error(f"Failed to get running EC2 instances: {str(e)}")
+        logger.error("Failed to get running EC2 instances: %s", e)
         return {}
 
 def get_reserved_ec2_instances(client):
@@ -115,27 +182,28 @@ def get_reserved_ec2_instances(client):
             Filters=[{'Name': 'state', 'Values': ['active']}]
         )
         
-        ri_type_count = defaultdict(int)
-        ri_details = []
+        reserved_instances = response['ReservedInstances']
+        ri_type_count = Counter()
+        ri_details = [None] * len(reserved_instances)
         
-        for ri in response['ReservedInstances']:
+        for i, ri in enumerate(reserved_instances):
             instance_type = ri['InstanceType']
             instance_count = ri['InstanceCount']
             ri_type_count[instance_type] += instance_count
             
-            ri_details.append({
+            ri_details[i] = {
                 'id': ri['ReservedInstancesId'],
                 'type': instance_type,
                 'count': instance_count,
                 'platform': ri.get('ProductDescription', 'Linux/UNIX'),
-                'end_date': ri['End'].strftime('%Y-%m-%d')
-            })
+                'end_date': ri['End'].isoformat()[:10]
+            }
         
         total_ris = sum(ri_type_count.values())
-        logger.debug(f"Found {total_ris} active Reserved Instances across {len(ri_type_count)} instance types")
+        logger.debug("Found %s active Reserved Instances across %s instance types", total_ris, len(ri_type_count))
         return {'count_by_type': ri_type_count, 'details': ri_details}
     except botocore.exceptions.ClientError as e:
-        logger.error(f"Failed to get Reserved Instances: {str(e)}")
+        logger.error("Failed to get Reserved Instances: %s", e)
         return {'count_by_type': {}, 'details': []}
 
 def get_ec2_reserved_instances(region=None):
@@ -149,5 +217,5 @@ def get_ec2_reserved_instances(region=None):
         list: Active reserved instances
     """
     # This would implement logic to list EC2 Reserved Instances
-    logger.debug(f"Retrieving active EC2 Reserved Instances in region: {region}")
+    logger.debug("Retrieving active EC2 Reserved Instances in region: %s", region)
     return []
\ No newline at end of file
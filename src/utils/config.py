@@ -0,0 +1,58 @@
+"""
+Configuration Utilities
+
+This module loads the shared YAML configuration used by the runners.
+"""
+
+import os
+import logging
+from functools import lru_cache
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+logger = logging.getLogger(__name__)
+
+# Project root, used to resolve relative configuration paths
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@lru_cache(maxsize=4)
+def _load_config(config_path, mtime):
+    """
+    Parse a configuration file, cached per path and modification time.
+    
+    Args:
+        config_path (str): Absolute path to configuration file
+        mtime (float): Modification time of the file, part of the cache key
+    
+    Returns:
+        dict: Configuration data
+    """
+    with open(config_path, 'r') as config_file:
+        config = yaml.load(config_file, Loader=_Loader)
+    logger.info("Configuration loaded from %s", config_path)
+    return config
+
+def load_config(config_path="config/settings.yaml"):
+    """
+    Load configuration from YAML file.
+    
+    The file is parsed once and reused until it changes on disk, so callers
+    share the returned dict and should not modify it.
+    
+    Args:
+        config_path (str): Path to configuration file, relative to the project root
+    
+    Returns:
+        dict: Configuration data
+    """
+    # Use absolute path for configuration file
+    if not os.path.isabs(config_path):
+        config_path = os.path.join(BASE_DIR, config_path)
+    config_path = os.path.abspath(config_path)
+    
+    return _load_config(config_path, os.path.getmtime(config_path))
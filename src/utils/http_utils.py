@@ -0,0 +1,82 @@
+"""
+HTTP Utilities
+
+This module provides helper functions shared by the HTTP-based integrations
+(Prometheus, Mattermost).
+"""
+
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Transient statuses worth retrying for both Prometheus and Mattermost
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def create_session(pool_connections=8, pool_maxsize=16, retries=3, backoff_factor=0.2,
+                   allowed_methods=('GET', 'POST'), read_retries=None):
+    """
+    Create a pooled requests session that retries transient failures.
+    
+    Args:
+        pool_connections (int): Number of per-host connection pools to cache
+        pool_maxsize (int): Maximum connections kept alive per host
+        retries (int): Total retry attempts for connection errors and transient statuses
+        backoff_factor (float): Exponential backoff factor between retries
+        allowed_methods (tuple): HTTP methods that may be retried
+        read_retries (int, optional): Retries after a read error or timeout; None
+            falls back to ``retries``. Use 0 for requests that must not be re-sent
+            once the server may have received them.
+        
+    Returns:
+        requests.Session: Configured session
+    """
+    retry = Retry(
+        total=retries,
+        read=read_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(allowed_methods),
+        # Hand the last response back so callers keep their own status handling
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def json_loads(data):
+    """
+    Parse a JSON document, using orjson when it is installed.
+    
+    Args:
+        data (bytes): Raw JSON payload, e.g. response.content
+        
+    Returns:
+        Parsed JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj):
+    """
+    Serialize a value to a JSON request body, using orjson when it is installed.
+    
+    Args:
+        obj: JSON-serializable value
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
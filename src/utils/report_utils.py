@@ -5,12 +5,62 @@ This module provides helper functions for generating and formatting reports.
 """
 
 import os
+import csv
+import html
+import json
 import logging
-import pandas as pd
-from datetime import datetime
+import operator
+from functools import lru_cache
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Static blocks and row templates of the markdown report
+_REPORT_TITLE = "# EC2 Reserved Instance Coverage Report\n\n"
+_RI_TABLE_HEADER = (
+    "\n### Currently Active Reserved Instances\n"
+    "| Instance Type | Count | Expiration Date |\n"
+    "|---------|------|--------|\n"
+)
+_RI_ROW_FMT = "| %s | %s | %s |\n"
+_UNCOVERED_ROW_FMT = " - %s x '%s' instances\n"
+_SUMMARY_HEADER = "## Summary\n"
+
+# RI details from the analyzer always carry an 'end_date'
+_end_date_key = operator.itemgetter('end_date')
+
+# Column order of the tabular (CSV/HTML/JSON) reports
+REPORT_COLUMNS = (
+    'Region',
+    'Running Instances',
+    'Reserved Instances',
+    'Uncovered Instances',
+    'Coverage Percentage',
+    'Timestamp',
+)
+_HTML_TEMPLATE = (
+    "<style>th, td {{ border: 1px solid gray; padding: 5px; }}</style>\n"
+    "<table>\n"
+    "<thead><tr>{header}</tr></thead>\n"
+    "<tbody>\n{body}</tbody>\n"
+    "</table>\n"
+)
+
+@lru_cache(maxsize=8)
+def _ensure_directory(output_dir):
+    """
+    Create a directory once per run; later calls are a cache hit.
+    
+    Args:
+        output_dir (str): Directory to create
+        
+    Returns:
+        str: The directory path
+    """
+    logger.debug("Ensuring report directory exists: %s", output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
 def ensure_report_directory(config):
     """
     Ensure the report directory exists.
@@ -21,11 +71,7 @@ def ensure_report_directory(config):
     Returns:
         str: Path to the report directory
     """
-    output_dir = config.get('output_dir', 'reports')
-    logger.debug(f"Ensuring report directory exists: {output_dir}")
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    return output_dir
+    return _ensure_directory(config.get('output_dir', 'reports'))
 
 def generate_report_filename(report_type, file_format):
     """
@@ -40,31 +86,35 @@ def generate_report_filename(report_type, file_format):
     """
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     filename = f"{report_type}_{timestamp}.{file_format}"
-    logger.debug(f"Generated report filename: {filename}")
+    logger.debug("Generated report filename: %s", filename)
     return filename
 
 def format_ri_coverage_data(report_data):
     """
-    Format RI coverage data into a pandas DataFrame.
+    Format RI coverage data into one row per region plus a summary row.
     
     Args:
         report_data (dict): Raw RI coverage report data
         
     Returns:
-        pd.DataFrame: Formatted report data
+        list: Formatted report rows as dicts keyed by REPORT_COLUMNS
     """
-    logger.debug("Formatting RI coverage data into DataFrame")
+    logger.debug("Formatting RI coverage data into report rows")
+    
+    # One timestamp for every row, even when the report carries none
+    timestamp = report_data.get('timestamp') or datetime.now().isoformat()
     
     # Create rows for each region
     rows = []
     for region_data in report_data.get('regions_data', []):
+        get = region_data.get
         row = {
-            'Region': region_data.get('region', 'Unknown'),
-            'Running Instances': region_data.get('total_instances', 0),
-            'Reserved Instances': region_data.get('total_reserved_instances', 0),
-            'Uncovered Instances': region_data.get('uncovered_instances', 0),
-            'Coverage Percentage': region_data.get('coverage_percentage', 0),
-            'Timestamp': report_data.get('timestamp', datetime.now().isoformat())
+            'Region': get('region', 'Unknown'),
+            'Running Instances': get('total_instances', 0),
+            'Reserved Instances': get('total_reserved_instances', 0),
+            'Uncovered Instances': get('uncovered_instances', 0),
+            'Coverage Percentage': get('coverage_percentage', 0),
+            'Timestamp': timestamp
         }
         rows.append(row)
     
@@ -76,18 +126,18 @@ def format_ri_coverage_data(report_data):
         'Reserved Instances': summary.get('total_reserved_instances', 0),
         'Uncovered Instances': summary.get('total_uncovered_instances', 0),
         'Coverage Percentage': summary.get('overall_coverage_percentage', 0),
-        'Timestamp': report_data.get('timestamp', datetime.now().isoformat())
+        'Timestamp': timestamp
     }
     rows.append(summary_row)
     
-    return pd.DataFrame(rows)
+    return rows
 
-def save_report_to_csv(df, filename, config):
+def save_report_to_csv(rows, filename, config):
     """
-    Save a DataFrame to a CSV file.
+    Save report rows to a CSV file.
     
     Args:
-        df (pd.DataFrame): Data to save
+        rows (list): Report rows from format_ri_coverage_data
         filename (str): Filename to save as
         config (dict): Report configuration
         
@@ -96,16 +146,21 @@ def save_report_to_csv(df, filename, config):
     """
     report_dir = ensure_report_directory(config)
     filepath = os.path.join(report_dir, filename)
-    logger.info(f"Saving report to CSV: {filepath}")
-    df.to_csv(filepath, index=False)
+    logger.info("Saving report to CSV: %s", filepath)
+    
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    
     return filepath
 
-def save_report_to_html(df, filename, config):
+def save_report_to_html(rows, filename, config):
     """
-    Save a DataFrame to an HTML file with styling.
+    Save report rows to an HTML file with styling.
     
     Args:
-        df (pd.DataFrame): Data to save
+        rows (list): Report rows from format_ri_coverage_data
         filename (str): Filename to save as
         config (dict): Report configuration
         
@@ -114,23 +169,27 @@ def save_report_to_html(df, filename, config):
     """
     report_dir = ensure_report_directory(config)
     filepath = os.path.join(report_dir, filename)
-    logger.info(f"Saving report to HTML: {filepath}")
+    logger.info("Saving report to HTML: %s", filepath)
     
-    # Add styling to the HTML report
-    styled_df = df.style.set_properties(**{
-        'border': '1px solid gray',
-        'padding': '5px',
-    })
+    header = "".join(f"<th>{html.escape(column)}</th>" for column in REPORT_COLUMNS)
+    body = "".join(
+        "<tr>" + "".join(
+            f"<td>{html.escape(str(row.get(column, '')))}</td>" for column in REPORT_COLUMNS
+        ) + "</tr>\n"
+        for row in rows
+    )
+    
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(_HTML_TEMPLATE.format(header=header, body=body))
     
-    styled_df.to_html(filepath)
     return filepath
 
-def save_report_to_json(df, filename, config):
+def save_report_to_json(rows, filename, config):
     """
-    Save a DataFrame to a JSON file.
+    Save report rows to a JSON file.
     
     Args:
-        df (pd.DataFrame): Data to save
+        rows (list): Report rows from format_ri_coverage_data
         filename (str): Filename to save as
         config (dict): Report configuration
         
@@ -139,8 +198,11 @@ def save_report_to_json(df, filename, config):
     """
     report_dir = ensure_report_directory(config)
     filepath = os.path.join(report_dir, filename)
-    logger.info(f"Saving report to JSON: {filepath}")
-    df.to_json(filepath, orient='records')
+    logger.info("Saving report to JSON: %s", filepath)
+    
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(rows, f)
+    
     return filepath
 
 def generate_markdown_report(report_data):
@@ -155,76 +217,77 @@ def generate_markdown_report(report_data):
     """
     logger.debug("Generating markdown report for RI coverage")
     
-    # Convert UTC timestamp to readable format
-    timestamp = datetime.fromisoformat(report_data['timestamp']).strftime('%Y-%m-%d %H:%M UTC')
+    # Convert UTC timestamp to readable format, using the current time if it is missing
+    raw_timestamp = report_data.get('timestamp') or datetime.now(timezone.utc).isoformat()
+    timestamp = datetime.fromisoformat(raw_timestamp).strftime('%Y-%m-%d %H:%M UTC')
     
     # Start the markdown report
-    markdown = f"# EC2 Reserved Instance Coverage Report\n\n"
-    markdown += f"Inspection Time: {timestamp}\n\n"
+    parts = [_REPORT_TITLE, f"Inspection Time: {timestamp}\n\n"]
     
     # Get soonest expiring RI info
     summary = report_data.get('summary', {})
     soonest_ri = summary.get('soonest_expiring_ri')
     
     if soonest_ri:
-        markdown += f"**Next RI Expiration:** {soonest_ri['type']} in {soonest_ri['region_name']} will expire on {soonest_ri['date']}\n\n"
+        parts.append(f"**Next RI Expiration:** {soonest_ri['type']} in {soonest_ri['region_name']} will expire on {soonest_ri['date']}\n\n")
     
     # Add region sections
     for region_data in report_data.get('regions_data', []):
-        region_name = region_data.get('region_name', region_data.get('region', 'Unknown Region'))
-        total_instances = region_data.get('total_instances', 0)
-        covered_instances = region_data.get('covered_instances', 0)
+        get = region_data.get
+        region_name = get('region_name') or get('region', 'Unknown Region')
+        total_instances = get('total_instances', 0)
+        covered_instances = get('covered_instances', 0)
+        
+        parts.append(f"## {region_name}\n")
         
         # Skip regions with no instances
         if total_instances == 0:
-            markdown += f"## {region_name}\n"
-            markdown += "No running EC2 instances in this region.\n\n"
+            parts.append("No running EC2 instances in this region.\n\n")
             continue
         
-        markdown += f"## {region_name}\n"
-        
         coverage_ratio = f"{covered_instances}/{total_instances}"
-        markdown += f"Currently running {total_instances} EC2 instances, with {coverage_ratio} instances covered by RIs"
+        parts.append(f"Currently running {total_instances} EC2 instances, with {coverage_ratio} instances covered by RIs")
         
         # Add uncovered instances by type if any
-        uncovered_by_type = region_data.get('uncovered_by_type', {})
+        uncovered_by_type = get('uncovered_by_type', {})
         if uncovered_by_type:
-            markdown += ", remaining:\n"
-            for instance_type, count in uncovered_by_type.items():
-                markdown += f" - {count} x '{instance_type}' instances\n"
+            parts.append(", remaining:\n")
+            parts.extend(
+                _UNCOVERED_ROW_FMT % (count, instance_type)
+                for instance_type, count in uncovered_by_type.items()
+            )
         else:
-            markdown += ". All instances are covered by RIs.\n"
+            parts.append(". All instances are covered by RIs.\n")
         
         # Add RI details if available
-        ri_details = region_data.get('ri_details', [])
+        ri_details = get('ri_details', [])
         if ri_details:
-            markdown += "\n### Currently Active Reserved Instances\n"
-            markdown += "| Instance Type | Count | Expiration Date |\n"
-            markdown += "|---------|------|--------|\n"
+            parts.append(_RI_TABLE_HEADER)
             
             # Sort RIs by expiration date
-            sorted_ris = sorted(ri_details, key=lambda x: x.get('end_date', '9999-12-31'))
-            
-            for ri in sorted_ris:
-                instance_type = ri.get('type', 'Unknown')
-                count = ri.get('count', 0)
-                end_date = ri.get('end_date', 'Unknown')
-                
-                markdown += f"| {instance_type} | {count} | {end_date} |\n"
+            sorted_ris = sorted(ri_details, key=_end_date_key)
+            parts.extend(
+                _RI_ROW_FMT % (
+                    ri.get('type', 'Unknown'),
+                    ri.get('count', 0),
+                    ri['end_date'],
+                )
+                for ri in sorted_ris
+            )
         
-        markdown += "\n"
+        parts.append("\n")
     
     # Add summary section
     total_instances = summary.get('total_instances', 0)
     total_ris = summary.get('total_reserved_instances', 0)
     overall_coverage = summary.get('overall_coverage_percentage', 0)
     
-    markdown += "## Summary\n"
-    markdown += f"- Total Running EC2 Instances: {total_instances}\n"
-    markdown += f"- Total Reserved Instances (RI): {total_ris}\n"
-    markdown += f"- Overall Coverage: {overall_coverage:.2f}%\n"
+    parts.append(_SUMMARY_HEADER)
+    parts.append(f"- Total Running EC2 Instances: {total_instances}\n")
+    parts.append(f"- Total Reserved Instances (RI): {total_ris}\n")
+    parts.append(f"- Overall Coverage: {overall_coverage:.2f}%\n")
     
-    return markdown
+    return "".join(parts)
 
 def save_markdown_report(markdown_content, filename, config):
     """
@@ -240,7 +303,7 @@ def save_markdown_report(markdown_content, filename, config):
     """
     report_dir = ensure_report_directory(config)
     filepath = os.path.join(report_dir, filename)
-    logger.info(f"Saving markdown report: {filepath}")
+    logger.info("Saving markdown report: %s", filepath)
     
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write(markdown_content)